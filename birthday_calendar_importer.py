@@ -7,30 +7,56 @@ Import birthdays from Excel/CSV and create recurring all-day events in Google Ca
 import os
 import re
 import sys
+import time
+import random
+import threading
 import logging
+import logging.handlers
+import queue
 import argparse
 import datetime
 import json
-from typing import List, Dict, Tuple, Optional, Any
-from dateutil import parser as date_parser
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Dict, Set, Tuple, Optional, Any
 
+import httplib2
 import pandas as pd
+from google.auth.exceptions import GoogleAuthError
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 from colorama import init, Fore, Style
 
+try:
+    import ciso8601
+except ImportError:  # optional C-level ISO 8601 parser
+    ciso8601 = None
+
+try:
+    import python_calamine
+except ImportError:  # optional Rust-based Excel reader (pandas engine='calamine')
+    python_calamine = None
+if python_calamine is not None and tuple(map(int, pd.__version__.split('.')[:2])) < (2, 2):
+    python_calamine = None  # pandas only has engine='calamine' from 2.2; use the openpyxl path
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # optional multithreaded CSV reader
+    pa = pa_csv = None
+
+try:
+    from tqdm import tqdm
+except ImportError:  # optional progress bar
+    tqdm = None
+
 init(autoreset=True)
 
 # Logging configuration
 LOG_FILENAME = "birthday_importer.log"
-logging.basicConfig(
-    filename=LOG_FILENAME,
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - %(message)s"
-)
 
 DATE_FORMAT_PATTERNS = {
     'DD/MM/YYYY': {
@@ -50,6 +76,89 @@ DATE_FORMAT_PATTERNS = {
     }
 }
 
+# Unambiguous layouts tried after the selected format's own patterns, so that
+# well-formed ISO dates (and stringified timestamps) never reach dateutil.
+FAST_FORMATS = ('%Y-%m-%d', '%Y/%m/%d', '%Y-%m-%d %H:%M:%S')
+
+# Numeric dates with the four-digit year first or last and one consistent
+# separator; the day/month order of the latter follows the selected format.
+ISO_DATE_RE = re.compile(r'(\d{4})([-/.])(\d{1,2})\2(\d{1,2})')
+NUMERIC_DATE_RE = re.compile(r'(\d{1,2})([-/. ])(\d{1,2})\2(\d{4})')
+
+STRICT_FORMATS = {
+    key: tuple(dict.fromkeys([*config['formats'], *FAST_FORMATS]))
+    for key, config in DATE_FORMAT_PATTERNS.items()
+}
+
+# (field order, separator) pairs of each key's strict formats, e.g. ('dmY', '/');
+# the regex fast path only accepts dates in one of these layouts
+_FORMAT_LAYOUT_RE = re.compile(r'%([dmY])(\W)%([dmY])\2%([dmY])')
+REGEX_LAYOUTS = {
+    key: frozenset((m[1] + m[3] + m[4], m[2]) for m in map(_FORMAT_LAYOUT_RE.fullmatch, formats) if m)
+    for key, formats in STRICT_FORMATS.items()
+}
+
+# Static parts of every event body, shared rather than rebuilt per event.
+# The API client only serializes these, so sharing the reminders dict is safe.
+EVENT_RECURRENCE = ('RRULE:FREQ=YEARLY',)
+EVENT_REMINDERS = {
+    'useDefault': False,
+    'overrides': [{'method': 'email', 'minutes': 1440}, {'method': 'popup', 'minutes': 1440}]
+}
+
+# Longer strings are rejected before the fuzzy fallback
+MAX_DATE_LENGTH = 64
+# All-day events end on the following date
+ONE_DAY = datetime.timedelta(days=1)
+
+# Case-folded title suffix identifying events created by this tool
+BIRTHDAY_SUFFIX = "'s birthday"
+
+# Server-side text filter for full listings. Not used for delta syncs:
+# cancelled events come back without a summary and would be filtered out.
+BIRTHDAY_QUERY = 'Birthday'
+
+# Partial response: only the fields sync_birthday_events reads
+EVENT_LIST_FIELDS = 'nextPageToken,updated,items(id,status,summary,start/date)'
+
+# Lookup default for names with no existing birthday event
+NO_EVENT_KEYS = frozenset()
+
+# Snapshot of existing birthday events, synced incrementally between runs
+EVENTS_CACHE_FILE = '.birthday_cache.json'
+
+# Google Calendar accepts at most 50 requests per batch HTTP call
+BATCH_SIZE = 50
+# Worker threads used when inserting without the batch endpoint
+MAX_WORKERS = 8
+MAX_RETRIES = 5
+# How a single API call can fail: an error response, a transport error
+# (timeout, reset connection) or a failed token refresh
+API_ERRORS = (HttpError, httplib2.HttpLib2Error, OSError, GoogleAuthError)
+# Progress lines buffered before writing when tqdm is not installed
+PROGRESS_FLUSH_EVERY = 100
+# Rows parsed per chunk when reading CSV files
+CSV_CHUNKSIZE = 100_000
+# Bytes per block when streaming CSV files with pyarrow
+ARROW_BLOCK_SIZE = 16 << 20
+
+
+def setup_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """Log to LOG_FILENAME through a queue; the caller stops the returned listener.
+
+    Records are formatted by the QueueHandler, then written to the file by a
+    background listener thread so disk I/O stays off the main thread.
+    """
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, logging.FileHandler(LOG_FILENAME))
+    logging.basicConfig(
+        handlers=[logging.handlers.QueueHandler(log_queue)],
+        level=level,
+        format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    listener.start()
+    return listener
+
 
 def print_header(text: str) -> None:
     print(f"\n{Fore.CYAN}{'='*60}\n{text}\n{'='*60}{Style.RESET_ALL}\n")
@@ -67,118 +176,318 @@ def print_info(text: str) -> None:
     print(f"{Fore.CYAN}ℹ {text}{Style.RESET_ALL}")
 
 
-def load_data(file_path: str, name_col: str, birthday_col: str) -> pd.DataFrame:
-    """Load spreadsheet data from Excel or CSV file."""
+def read_xlsx_columns(file_path: str, columns: List[str]) -> pd.DataFrame:
+    """Stream only the requested columns from the active sheet of an .xlsx workbook.
+
+    Uses openpyxl's read-only mode so rows are read lazily instead of loading
+    the whole workbook into memory. Like pd.read_excel, every row up to the
+    last non-blank one is kept, so blank rows are reported as invalid and
+    row numbers match.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        headers = list(next(rows, ()))
+        for col in columns:
+            if col not in headers:
+                available = ', '.join(str(h) for h in headers if h is not None)
+                raise ValueError(f"Column '{col}' not found. Available: {available}")
+        positions = [headers.index(col) for col in columns]
+
+        data, used = [], 0
+        for row in rows:
+            data.append(tuple(row[pos] if pos < len(row) else None for pos in positions))
+            if any(value is not None for value in row):
+                used = len(data)
+    finally:
+        wb.close()
+
+    # Read-only sheets can report trailing empty rows; pd.read_excel drops those
+    return pd.DataFrame(data[:used], columns=columns)
+
+
+def read_excel_columns(file_path: str, name_col: str, birthday_col: str, engine: Optional[str] = None) -> pd.DataFrame:
+    """Read only the name and birthday columns of an Excel file.
+
+    Pass engine='calamine' to use the Rust-based reader.
+    """
+    wanted = {name_col, birthday_col}
+    df = pd.read_excel(file_path, engine=engine, usecols=lambda col: col in wanted, dtype={name_col: str})
+    for col in (name_col, birthday_col):
+        if col not in df.columns:
+            headers = pd.read_excel(file_path, engine=engine, nrows=0).columns
+            raise ValueError(f"Column '{col}' not found. Available: {', '.join(map(str, headers))}")
+    return df
+
+
+def iter_csv_chunks(file_path: str, name_col: str, birthday_col: str, chunksize: int = CSV_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    """Yield the name and birthday columns of a CSV file, chunksize rows at a time."""
+    headers = list(pd.read_csv(file_path, nrows=0).columns)
+    for col in (name_col, birthday_col):
+        if col not in headers:
+            raise ValueError(f"Column '{col}' not found. Available: {', '.join(headers)}")
+
+    # Both columns are read as text; validate_data parses the dates, so type inference is wasted work
+    if pa_csv is not None:
+        chunks = iter_arrow_csv_chunks(file_path, [name_col, birthday_col])
+    else:
+        chunks = pd.read_csv(file_path, usecols=[name_col, birthday_col], dtype={name_col: str, birthday_col: str},
+                             chunksize=chunksize)
+    empty = True
+    for chunk in chunks:
+        empty = False
+        yield chunk
+    if empty:
+        yield pd.DataFrame(columns=[name_col, birthday_col])
+
+
+def iter_arrow_csv_chunks(file_path: str, columns: List[str]) -> Iterator[pd.DataFrame]:
+    """Stream the given CSV columns as text with pyarrow's multithreaded reader.
+
+    Chunks are ARROW_BLOCK_SIZE bytes of input each. Empty cells become
+    missing values (None) and the index counts data rows across chunks, as with pd.read_csv.
+    """
+    reader = pa_csv.open_csv(
+        file_path,
+        read_options=pa_csv.ReadOptions(block_size=ARROW_BLOCK_SIZE),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=columns,
+            column_types={col: pa.string() for col in columns},
+            strings_can_be_null=True,
+        ),
+    )
+    start = 0
+    for batch in reader:
+        df = batch.to_pandas()
+        df.index += start
+        start += len(df)
+        yield df
+
+
+def iter_chunks(file_path: str, name_col: str, birthday_col: str, chunksize: int = CSV_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    """Yield the file's rows as DataFrames with Name and Birthday columns.
+
+    CSV files are streamed chunksize rows at a time so callers can process
+    them with bounded memory. pandas cannot stream Excel files, so those are
+    yielded as a single frame. Row index labels are preserved across chunks.
+    """
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
 
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext in ['.xlsx', '.xls'] and python_calamine is not None:
+        frames = [read_excel_columns(file_path, name_col, birthday_col, engine='calamine')]
+    elif ext == '.xlsx':
+        frames = [read_xlsx_columns(file_path, [name_col, birthday_col])]
+    elif ext == '.xls':
+        frames = [read_excel_columns(file_path, name_col, birthday_col)]
+    elif ext == '.csv':
+        frames = iter_csv_chunks(file_path, name_col, birthday_col, chunksize)
+    else:
+        raise ValueError(f"Unsupported file type: {ext}")
+
+    for df in frames:
+        yield df.rename(columns={name_col: "Name", birthday_col: "Birthday"})
+
+
+def load_data(file_path: str, name_col: str, birthday_col: str, date_format: str = 'DD/MM/YYYY') -> pd.DataFrame:
+    """Load and validate spreadsheet data from Excel or CSV file.
+
+    CSV files are validated chunk by chunk rather than loaded whole; the
+    result is the concatenated validate_data output.
+    """
     try:
-        ext = os.path.splitext(file_path)[1].lower()
-        if ext in ['.xlsx', '.xls']:
-            df = pd.read_excel(file_path, engine='openpyxl' if ext == '.xlsx' else None)
-        elif ext == '.csv':
-            df = pd.read_csv(file_path)
-        else:
-            raise ValueError(f"Unsupported file type: {ext}")
-        
-        logging.info(f"Loaded {len(df)} rows from {file_path}")
-        print_success(f"Loaded {len(df)} rows from {os.path.basename(file_path)}")
-        
+        entries = pd.concat([validate_data(chunk, date_format)
+                             for chunk in iter_chunks(file_path, name_col, birthday_col)], ignore_index=True)
+        logging.info("Loaded %d rows from %s", len(entries), file_path)
+        print_success(f"Loaded {len(entries)} rows from {os.path.basename(file_path)}")
+
     except Exception as e:
-        logging.error(f"Error loading file: {e}")
+        logging.error("Error loading file: %s", e)
         raise
 
-    if name_col not in df.columns:
-        raise ValueError(f"Column '{name_col}' not found. Available: {', '.join(df.columns)}")
-    
-    if birthday_col not in df.columns:
-        raise ValueError(f"Column '{birthday_col}' not found. Available: {', '.join(df.columns)}")
-
-    return df.rename(columns={name_col: "Name", birthday_col: "Birthday"})
+    return entries
 
 
 def parse_birthday(birthday_raw: Any, date_format: str = 'DD/MM/YYYY') -> Tuple[Optional[datetime.date], Optional[str]]:
     """Parse a birthday value into a datetime.date object."""
-    if pd.isna(birthday_raw):
+    # Strings are the common case here, and pd.isna is slow on scalars
+    if type(birthday_raw) is str:
+        date_str = birthday_raw.strip()
+    elif pd.isna(birthday_raw):
         return None, "Missing birthday value"
+    elif isinstance(birthday_raw, (pd.Timestamp, datetime.datetime)):
+        birthday = birthday_raw.date()
+        if birthday.year < 1900 or birthday.year > datetime.datetime.now().year:
+            return None, f"Invalid year: {birthday.year}"
+        return birthday, None
+    else:
+        date_str = str(birthday_raw).strip()
     
-    if isinstance(birthday_raw, (pd.Timestamp, datetime.datetime)):
-        return birthday_raw.date(), None
-    
-    date_str = str(birthday_raw).strip()
     if not date_str or date_str.lower() in ['nan', 'none', 'nat', '']:
         return None, "Empty birthday value"
     
+    return _parse_date_str(date_str, date_format)
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_date_str(date_str: str, date_format: str) -> Tuple[Optional[datetime.date], Optional[str]]:
+    """Parse a stripped date string; cached since spreadsheets repeat dates."""
     format_config = DATE_FORMAT_PATTERNS.get(date_format, DATE_FORMAT_PATTERNS['DD/MM/YYYY'])
+    strict_formats = STRICT_FORMATS.get(date_format, STRICT_FORMATS['DD/MM/YYYY'])
+    current_year = datetime.datetime.now().year
     
-    # Try strict formats
-    for fmt in format_config['formats']:
+    # Plain numeric dates are split by regex, skipping strptime's format parsing,
+    # but only in layouts one of the strict formats would have accepted
+    layouts = REGEX_LAYOUTS.get(date_format, REGEX_LAYOUTS['DD/MM/YYYY'])
+    fields = None
+    match = ISO_DATE_RE.fullmatch(date_str)
+    if match:
+        if ('Ymd', match[2]) in layouts:
+            fields = match[1], match[3], match[4]
+    else:
+        match = NUMERIC_DATE_RE.fullmatch(date_str)
+        if match:
+            order = 'dmY' if format_config['dayfirst'] else 'mdY'
+            if (order, match[2]) in layouts:
+                day, month = (match[1], match[3]) if order == 'dmY' else (match[3], match[1])
+                fields = match[4], month, day
+    if fields:
+        year, month, day = fields
         try:
-            parsed_date = datetime.datetime.strptime(date_str, fmt).date()
-            current_year = datetime.datetime.now().year
+            parsed_date = datetime.date(int(year), int(month), int(day))
+        except ValueError:
+            pass
+        else:
             if parsed_date.year < 1900 or parsed_date.year > current_year:
                 return None, f"Invalid year: {parsed_date.year}"
             return parsed_date, None
+    
+    # Try strict formats next; only fall back to fuzzy parsing on total failure
+    for fmt in strict_formats:
+        try:
+            parsed_date = datetime.datetime.strptime(date_str, fmt).date()
         except ValueError:
             continue
+        if parsed_date.year < 1900 or parsed_date.year > current_year:
+            return None, f"Invalid year: {parsed_date.year}"
+        return parsed_date, None
+    
+    # ISO 8601 variants the strict formats miss (compact, with time/zone)
+    if ciso8601 is not None:
+        try:
+            parsed_date = ciso8601.parse_datetime(date_str).date()
+        except ValueError:
+            pass
+        else:
+            if parsed_date.year < 1900 or parsed_date.year > current_year:
+                return None, f"Invalid year: {parsed_date.year}"
+            return parsed_date, None
     
-    # Fuzzy fallback
+    # Cheap rejections so garbage never reaches the (slow) fuzzy parser
+    if len(date_str) > MAX_DATE_LENGTH:
+        return None, f"Value too long to be a date ({len(date_str)} chars)"
+    if not any(ch.isdigit() for ch in date_str):
+        return None, f"No digits in '{date_str}'"
+    
+    # Fuzzy fallback; dateutil is only imported once strict parsing fails
+    from dateutil import parser as date_parser
     try:
         parsed_date = date_parser.parse(date_str, fuzzy=True, dayfirst=format_config['dayfirst']).date()
-        current_year = datetime.datetime.now().year
         if parsed_date.year < 1900 or parsed_date.year > current_year:
             return None, f"Invalid year: {parsed_date.year}"
-        logging.warning(f"Fuzzy parsed: {date_str} -> {parsed_date}")
+        logging.warning("Fuzzy parsed: %s -> %s", date_str, parsed_date)
         return parsed_date, None
     except Exception as e:
         return None, f"Invalid format: '{date_str}'"
 
 
-def validate_data(df: pd.DataFrame, date_format: str = 'DD/MM/YYYY') -> Tuple[List[Dict], List[Dict]]:
-    """Validate each row for non-empty name and parsable birthday."""
-    valid, invalid = [], []
-    print_info(f"Validating with format: {DATE_FORMAT_PATTERNS[date_format]['description']}")
+def validate_data(df: pd.DataFrame, date_format: str = 'DD/MM/YYYY') -> pd.DataFrame:
+    """Validate each row for non-empty name and parsable birthday.
 
-    for index, row in df.iterrows():
-        name = str(row.get("Name", "")).strip()
-        birthday_raw = row.get("Birthday")
-        errors = []
+    Birthdays are parsed with vectorized passes over the selected format's
+    strict patterns; only the cells pandas cannot parse go through
+    parse_birthday.
 
-        if not name or name.lower() == 'nan':
-            errors.append("Empty name")
-        
-        birthday, error = parse_birthday(birthday_raw, date_format)
-        if error:
-            errors.append(error)
+    Returns one row per input row with columns Row, Name, NameKey,
+    Birthday, BirthdayRaw, Errors and a boolean valid flag. Birthday is a
+    datetime64 column (NaT where invalid) and the names use the string
+    dtype, so entries stay columnar until events are emitted.
+    """
+    names = df["Name"].astype(str).str.strip()
+    # Case-folded once here and reused for duplicate matching
+    name_keys = names.str.casefold()
+    name_ok = df["Name"].notna() & names.ne("") & name_keys.ne("nan")
+
+    birthdays_raw = df["Birthday"]
+    current_year = datetime.datetime.now().year
+    if pd.api.types.is_datetime64_any_dtype(birthdays_raw):
+        parsed = birthdays_raw
+    else:
+        # One vectorized pass per strict format, each over the still-unparsed rows
+        strings = birthdays_raw.astype(str).str.strip()
+        parsed = pd.Series(pd.NaT, index=strings.index, dtype="datetime64[ns]")
+        for fmt in STRICT_FORMATS[date_format]:
+            todo = parsed.isna()
+            if not todo.any():
+                break
+            result = pd.to_datetime(strings[todo], format=fmt, errors="coerce")
+            # pandas 3 may return a coarser unit that holds years outside the
+            # nanosecond range; leave those to parse_birthday's year check
+            in_range = result.dt.year.between(1900, current_year)
+            parsed[todo] = result.where(in_range).astype("datetime64[ns]")
+    date_ok = parsed.notna() & parsed.dt.year.between(1900, current_year)
 
-        entry = {"index": index + 1, "Name": name, "Birthday": birthday, "BirthdayRaw": birthday_raw}
-        if errors:
-            entry["Errors"] = errors
-            invalid.append(entry)
+    entries = pd.DataFrame({
+        "Row": df.index + 1,
+        "Name": names.astype("string"),
+        "NameKey": name_keys.astype("string"),
+        "Birthday": parsed.dt.normalize().where(date_ok),
+        "BirthdayRaw": birthdays_raw,
+    })
+    # Error tuples are only built for failing rows; valid rows share ()
+    errors = [() if ok else ("Empty name",) for ok in name_ok]
+    date_valid = date_ok.to_numpy().copy()
+
+    birthday_col = entries.columns.get_loc("Birthday")
+    # Plain array indexing; Series.iat goes through pandas' indexing machinery per row
+    raw_values = birthdays_raw.to_numpy()
+    for pos in (~date_valid).nonzero()[0]:
+        birthday, error = parse_birthday(raw_values[pos], date_format)
+        if birthday is not None:
+            entries.iat[pos, birthday_col] = pd.Timestamp(birthday)
+        if error:
+            errors[pos] += (error,)
         else:
-            valid.append(entry)
+            date_valid[pos] = True
 
-    return valid, invalid
+    entries["Errors"] = errors
+    entries["valid"] = name_ok.to_numpy() & date_valid
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("Date string cache: %s", _parse_date_str.cache_info())
+    return entries
 
 
-def preview_sample_dates(valid_entries: List[Dict], sample_size: int = 5) -> None:
-    if not valid_entries: return
+def preview_sample_dates(valid_entries: pd.DataFrame, sample_size: int = 5) -> None:
+    if valid_entries.empty: return
     print_header("Sample Parsed Dates")
     print(f"{'Row':<6} {'Name':<25} {'Original':<20} {'Parsed'}")
     print("-" * 70)
-    for entry in valid_entries[:sample_size]:
-        print(f"{entry['index']:<6} {entry['Name'][:24]:<25} {str(entry['BirthdayRaw'])[:19]:<20} {entry['Birthday'].strftime('%d %b %Y')}")
+    for entry in valid_entries.head(sample_size).itertuples(index=False):
+        print(f"{entry.Row:<6} {entry.Name[:24]:<25} {str(entry.BirthdayRaw)[:19]:<20} {entry.Birthday.strftime('%d %b %Y')}")
     if len(valid_entries) > sample_size:
         print(f"\n... and {len(valid_entries) - sample_size} more")
 
 
-def preview_data(valid: List[Dict], invalid: List[Dict]) -> None:
+def preview_data(valid: pd.DataFrame, invalid: pd.DataFrame) -> None:
     print_header("Validation Summary")
     print(f"{Fore.GREEN}Valid: {len(valid)}{Style.RESET_ALL} | {Fore.RED}Invalid: {len(invalid)}{Style.RESET_ALL}\n")
-    if invalid:
+    if not invalid.empty:
         print(f"{Fore.RED}Invalid Details:{Style.RESET_ALL}")
-        for entry in invalid[:10]:
-            print(f"Row {entry['index']}: {entry.get('Name')} | {entry.get('BirthdayRaw')} | {'; '.join(entry['Errors'])}")
+        for entry in invalid.head(10).itertuples(index=False):
+            print(f"Row {entry.Row}: {entry.Name} | {entry.BirthdayRaw} | {'; '.join(entry.Errors)}")
         if len(invalid) > 10: print(f"... and {len(invalid) - 10} more")
 
 
@@ -189,8 +498,12 @@ def get_user_confirmation(prompt: str = "Proceed? (y/n): ") -> bool:
         if choice in ["n", "no"]: return False
 
 
-def authenticate_google_calendar():
-    """Authenticate with Google Calendar API using google-auth."""
+@functools.lru_cache(maxsize=1)
+def get_credentials() -> Credentials:
+    """Load OAuth credentials from token.json, refreshing or re-authorizing as needed.
+
+    Memoized so repeated calls in one process (e.g. a notebook) reuse them.
+    """
     SCOPES = ['https://www.googleapis.com/auth/calendar']
     CLIENT_SECRET_FILE, TOKEN_FILE = 'credentials.json', 'token.json'
 
@@ -205,88 +518,462 @@ def authenticate_google_calendar():
         if creds and creds.expired and creds.refresh_token:
             creds.refresh(Request())
         else:
+            from google_auth_oauthlib.flow import InstalledAppFlow
             flow = InstalledAppFlow.from_client_secrets_file(CLIENT_SECRET_FILE, SCOPES)
             creds = flow.run_local_server(port=0)
         with open(TOKEN_FILE, 'w') as token:
             token.write(creds.to_json())
-    
-    service = build('calendar', 'v3', credentials=creds)
+    return creds
+
+
+@functools.lru_cache(maxsize=4)
+def authenticate_google_calendar(creds: Optional[Credentials] = None):
+    """Authenticate with Google Calendar API using google-auth.
+
+    The service is memoized per credentials object; its authorized Http
+    refreshes expired access tokens by itself, so reuse needs no TTL.
+    """
+    from googleapiclient.discovery import build
+
+    # Use the discovery document bundled with the client instead of fetching it
+    service = build('calendar', 'v3', credentials=creds or get_credentials(),
+                    static_discovery=True, cache_discovery=False)
     print_success("Authenticated with Google Calendar")
     return service
 
 
-def get_existing_events(service, calendar_id: str) -> Dict[str, List[datetime.date]]:
-    """Batch fetch existing birthday events to optimize duplicate detection."""
+def events_cache_key(service, calendar_id: str) -> str:
+    """Key for a calendar's cached snapshot: '<account>|<calendar id>'.
+
+    'primary' is an alias that names a different calendar for every account,
+    so both parts are resolved through the API; the id of an account's
+    primary calendar is its email address.
+    """
+    calendars = service.calendars()
+    account = calendars.get(calendarId='primary', fields='id').execute()['id']
+    if calendar_id == 'primary':
+        return f"{account}|{account}"
+    return f"{account}|{calendars.get(calendarId=calendar_id, fields='id').execute()['id']}"
+
+
+def load_events_cache(cache_key: str) -> Optional[Dict]:
+    """Return the cached {'updated', 'events'} snapshot for a calendar, if any."""
+    if not os.path.exists(EVENTS_CACHE_FILE):
+        return None
+    try:
+        with open(EVENTS_CACHE_FILE) as f:
+            return json.load(f).get(cache_key)
+    except (OSError, ValueError) as e:
+        logging.warning("Ignoring unreadable events cache: %s", e)
+        return None
+
+
+def save_events_cache(cache_key: str, updated: str, events: Dict[str, List]) -> None:
+    cache = {}
+    if os.path.exists(EVENTS_CACHE_FILE):
+        try:
+            with open(EVENTS_CACHE_FILE) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+    cache[cache_key] = {'updated': updated, 'events': events}
+    try:
+        with open(EVENTS_CACHE_FILE, 'w') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        logging.warning("Could not write events cache: %s", e)
+
+
+def sync_birthday_events(service, calendar_id: str, events: Dict[str, List], **list_params) -> Optional[str]:
+    """Page through events.list, updating {event_id: [name, month, day]} in place.
+
+    Cancelled events and events no longer titled as birthdays are dropped.
+    Returns the calendar's server-side `updated` time from the first page,
+    the watermark for the next incremental sync.
+    """
+    page_token, updated = None, None
+    while True:
+        events_result = service.events().list(
+            calendarId=calendar_id, pageToken=page_token, maxResults=2500,
+            fields=EVENT_LIST_FIELDS, **list_params
+        ).execute()
+        updated = updated or events_result.get('updated')
+        for event in events_result.get('items', []):
+            summary = event.get('summary', '').casefold()
+            date_str = event.get('start', {}).get('date')
+            if event.get('status') != 'cancelled' and summary.endswith(BIRTHDAY_SUFFIX) and date_str:
+                # All-day start dates are always YYYY-MM-DD; slice instead of building a date
+                events[event['id']] = [summary[:-len(BIRTHDAY_SUFFIX)].strip(), int(date_str[5:7]), int(date_str[8:10])]
+            else:
+                events.pop(event['id'], None)
+        page_token = events_result.get('nextPageToken')
+        if not page_token: break
+    return updated
+
+
+def get_existing_events(service, calendar_id: str, use_cache: bool = True) -> Dict[str, Set[Tuple[int, int]]]:
+    """Batch fetch existing birthday events to optimize duplicate detection.
+
+    Recurring events are listed once (not expanded into instances), and each
+    name maps to the set of (month, day) keys it already has an event on.
+    Results are cached in EVENTS_CACHE_FILE, per account and calendar, so
+    later runs only fetch events changed since the previous sync.
+    """
     print_info("Checking existing calendar events...")
-    existing = {}
+    cache_key = cache = None
+    if use_cache:
+        try:
+            cache_key = events_cache_key(service, calendar_id)
+        except API_ERRORS as e:
+            logging.warning("Could not resolve calendar for the events cache, fetching all events: %s", e)
+        else:
+            cache = load_events_cache(cache_key)
     try:
-        page_token = None
-        while True:
-            events_result = service.events().list(
-                calendarId=calendar_id, pageToken=page_token, singleEvents=True, maxResults=2500
-            ).execute()
-            for event in events_result.get('items', []):
-                summary = event.get('summary', '')
-                if "'s Birthday" in summary:
-                    name = summary.replace("'s Birthday", "").strip().lower()
-                    date_str = event.get('start', {}).get('date')
-                    if date_str:
-                        d = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-                        existing.setdefault(name, []).append(d)
-            page_token = events_result.get('nextPageToken')
-            if not page_token: break
-        return existing
+        events = {}
+        if cache:
+            events = cache['events']
+            try:
+                synced_at = sync_birthday_events(service, calendar_id, events,
+                                                 updatedMin=cache['updated'], showDeleted=True)
+            except HttpError as e:
+                # 410 Gone: the cache is too old for an incremental sync
+                if e.resp.status != 410: raise
+                events = {}
+                synced_at = sync_birthday_events(service, calendar_id, events, q=BIRTHDAY_QUERY)
+        else:
+            synced_at = sync_birthday_events(service, calendar_id, events, q=BIRTHDAY_QUERY)
     except HttpError as e:
-        logging.error(f"Error fetching duplicates: {e}")
+        logging.error("Error fetching duplicates: %s", e)
         return {}
 
+    # The watermark comes from Google's clock, not ours; without one the cache keeps its old (earlier) one
+    if synced_at and cache_key:
+        save_events_cache(cache_key, synced_at, events)
+    existing = {}
+    for name, month, day in events.values():
+        existing.setdefault(name, set()).add((month, day))
+    return existing
 
-def is_duplicate(existing_events: Dict[str, List[datetime.date]], name: str, date: datetime.date) -> bool:
-    name_key = name.lower()
-    if name_key not in existing_events: return False
-    return any(d.month == date.month and d.day == date.day for d in existing_events[name_key])
 
+def is_duplicate(existing_events: Dict[str, Set[Tuple[int, int]]], name_key: str, date: datetime.date) -> bool:
+    return (date.month, date.day) in existing_events.get(name_key, NO_EVENT_KEYS)
 
-def create_birthday_event(service, calendar_id: str, name: str, birthday: datetime.date, dry_run: bool = False) -> Optional[Dict]:
-    """Create a recurring yearly all-day event."""
-    title = f"{name}'s Birthday"
-    # Anchor to current year
-    start_date = birthday.replace(year=datetime.datetime.now().year)
+
+def is_rate_limited(error: HttpError) -> bool:
+    """Whether an API error is a transient quota/backend error worth retrying."""
+    # BatchError (a malformed batch response) is often raised without a response
+    if error.resp is None:
+        return False
+    status = error.resp.status
+    if status == 403:
+        return b'ratelimitexceeded' in (error.content or b'').lower()
+    return status in (429, 500, 503)
+
+
+def execute_with_backoff(request, http=None, max_retries: int = MAX_RETRIES) -> Dict:
+    """Execute an API request, backing off exponentially on rate-limit errors.
+
+    A Retry-After header sent by the server takes precedence over the computed delay.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return request.execute(http=http)
+        except HttpError as e:
+            if attempt == max_retries or not is_rate_limited(e):
+                raise
+            retry_after = e.resp.get('retry-after', '')
+            delay = int(retry_after) if retry_after.isdigit() else 2 ** attempt + random.random()
+            logging.warning("Rate limited (HTTP %s), retrying in %.1fs", e.resp.status, delay)
+            time.sleep(delay)
+
+
+def execute_batch(service, requests: List[Tuple[str, Any]], callback, max_retries: int = MAX_RETRIES, http=None) -> None:
+    """Execute up to BATCH_SIZE (request_id, request) pairs as one batch HTTP call.
+
+    Sub-requests rejected by rate limiting are retried in a new batch with
+    exponential backoff; every other outcome is passed to
+    callback(request_id, response, exception). Errors from the batch call
+    itself propagate, leaving the still-pending requests to the caller.
+    """
+    pending = dict(requests)
+    for attempt in range(max_retries + 1):
+        throttled = {}
+
+        def on_response(request_id: str, response: Optional[Dict], exception: Optional[HttpError]) -> None:
+            if exception is not None and attempt < max_retries and is_rate_limited(exception):
+                throttled[request_id] = pending[request_id]
+            else:
+                callback(request_id, response, exception)
+
+        batch = service.new_batch_http_request(callback=on_response)
+        for request_id, request in pending.items():
+            batch.add(request, request_id=request_id)
+        execute_with_backoff(batch, http=http)
+
+        if not throttled:
+            return
+        delay = 2 ** attempt + random.random()
+        logging.warning("%d batched requests rate limited, retrying in %.1fs", len(throttled), delay)
+        time.sleep(delay)
+        pending = throttled
+
+
+def execute_batches(service, batches: List[List[Tuple[str, Any]]], callback, creds: Optional[Credentials] = None,
+                    max_workers: int = MAX_WORKERS) -> List[Tuple[List[Tuple[str, Any]], Exception]]:
+    """Execute several batches, overlapping up to max_workers batch calls when creds are given.
+
+    Each worker sends its batches through its own authorized Http, and all
+    results are passed to callback(request_id, response, exception) on the
+    calling thread. Returns (requests, error) for every batch call that
+    failed as a whole (any of API_ERRORS); results it did return have
+    already been reported.
+    """
+    local = threading.local()
+
+    def run(requests: List[Tuple[str, Any]]) -> Tuple[List[Tuple], Optional[Exception]]:
+        results, http = [], None
+        if creds is not None:
+            if not hasattr(local, 'http'):
+                local.http = AuthorizedHttp(creds, http=build_http())
+            http = local.http
+        try:
+            execute_batch(service, requests, lambda *result: results.append(result), http=http)
+        except API_ERRORS as e:
+            return results, e
+        return results, None
+
+    failures = []
+
+    def collect(requests: List[Tuple[str, Any]], results: List[Tuple], error: Optional[Exception]) -> None:
+        for result in results:
+            callback(*result)
+        if error is not None:
+            failures.append((requests, error))
+
+    if creds is None or max_workers <= 1 or len(batches) <= 1:
+        for requests in batches:
+            collect(requests, *run(requests))
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(run, requests): requests for requests in batches}
+            for future in as_completed(futures):
+                collect(futures[future], *future.result())
+    return failures
+
+
+def build_event_body(name: str, birthday: datetime.date, year: Optional[int] = None) -> Dict:
+    """Build the request body for a recurring yearly all-day event.
+
+    The event is anchored to `year` (default: the current year); callers
+    building many bodies can pass it once instead of re-reading the clock.
+    """
+    start_date = birthday.replace(year=year or datetime.date.today().year)
     
-    body = {
-        'summary': title,
-        'start': {'date': start_date.strftime("%Y-%m-%d")},
-        'end': {'date': (start_date + datetime.timedelta(days=1)).strftime("%Y-%m-%d")},
-        'recurrence': ['RRULE:FREQ=YEARLY'],
-        'reminders': {
-            'useDefault': False,
-            'overrides': [{'method': 'email', 'minutes': 1440}, {'method': 'popup', 'minutes': 1440}]
-        }
+    return {
+        'summary': f"{name}'s Birthday",
+        'start': {'date': start_date.isoformat()},
+        'end': {'date': (start_date + ONE_DAY).isoformat()},
+        'recurrence': EVENT_RECURRENCE,
+        'reminders': EVENT_REMINDERS,
     }
 
+
+def create_birthday_event(service, calendar_id: str, name: str, birthday: datetime.date, dry_run: bool = False, http=None) -> Optional[Dict]:
+    """Create a recurring yearly all-day event."""
+    body = build_event_body(name, birthday)
+
     if dry_run:
-        print_info(f"[DRY RUN] Would create: {title}")
+        print_info(f"[DRY RUN] Would create: {body['summary']}")
         return None
 
-    try:
-        return service.events().insert(calendarId=calendar_id, body=body).execute()
-    except HttpError as e:
-        logging.error(f"Failed to create event for {name}: {e}")
-        raise
+    if service is None:
+        raise ValueError("a Calendar service is required unless dry_run is set")
+    # Failures are logged by the caller's ProgressPrinter
+    return execute_with_backoff(service.events().insert(calendarId=calendar_id, body=body), http=http)
+
 
+class ProgressPrinter:
+    """Report per-event results without a console write for every event.
 
-def rollback_events(service, calendar_id: str, event_ids: List[str]):
+    Draws a tqdm bar when tqdm is installed (failures are still listed);
+    otherwise lines are buffered and written flush_every at a time.
+    """
+
+    def __init__(self, total: int, flush_every: int = PROGRESS_FLUSH_EVERY):
+        self.total = total
+        self.flush_every = flush_every
+        self.lines = []
+        self.bar = None
+        if tqdm is not None and flush_every > 1:
+            self.bar = tqdm(total=total, desc="Creating", unit="ev", mininterval=0.5)
+
+    def __enter__(self) -> "ProgressPrinter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self.bar is not None:
+            self.bar.close()
+        self.flush()
+
+    def report(self, i: int, name: str, error: Optional[Exception] = None) -> None:
+        if error is not None:
+            logging.error("Failed to create event for %s: %s", name, error)
+        if self.bar is not None:
+            self.bar.update(1)
+            if error is not None:
+                self.bar.write(f"✗ {name}: {error}")
+            return
+        if error is None:
+            self.lines.append(f"[{i}/{self.total}] ✓ {name}")
+        else:
+            self.lines.append(f"[{i}/{self.total}] ✗ {name}: {error}")
+        if len(self.lines) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.lines:
+            sys.stdout.write("\n".join(self.lines) + "\n")
+            sys.stdout.flush()
+            self.lines.clear()
+
+
+def insert_concurrently(service, creds: Credentials, calendar_id: str, items: List[Tuple[str, str, datetime.date]],
+                        callback, max_workers: int = MAX_WORKERS) -> None:
+    """Insert (request_id, name, birthday) items as single requests on a thread pool.
+
+    httplib2 connections are not thread-safe, so each worker executes through
+    its own authorized Http. Results are passed to
+    callback(request_id, response, exception) on the calling thread.
+    """
+    local = threading.local()
+
+    def insert(name: str, birthday: datetime.date) -> Optional[Dict]:
+        if not hasattr(local, 'http'):
+            local.http = AuthorizedHttp(creds, http=build_http())
+        return create_birthday_event(service, calendar_id, name, birthday, http=local.http)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(insert, name, birthday): request_id for request_id, name, birthday in items}
+        for future in as_completed(futures):
+            try:
+                response = future.result()
+            except API_ERRORS + (ValueError,) as e:
+                callback(futures[future], None, e)
+                continue
+            callback(futures[future], response, None)
+
+
+def create_birthday_events(service, calendar_id: str, entries: pd.DataFrame, dry_run: bool = False,
+                           creds: Optional[Credentials] = None, use_batch: bool = True,
+                           max_workers: int = MAX_WORKERS) -> Tuple[List[str], int]:
+    """Create events for all entries.
+
+    By default up to BATCH_SIZE inserts are packed into each HTTP request and,
+    given creds, up to max_workers batch calls run at once; if a whole batch
+    call is rejected with an HTTP error its inserts are retried as concurrent
+    single requests, while transport failures count them as failed. With
+    use_batch=False every insert is a single request on the thread pool.
+
+    Returns the created event IDs and the number of failures.
+    """
+    created_ids, failed = [], 0
+    names, birthdays = entries["Name"].tolist(), entries["Birthday"].dt.date.tolist()
+    total = len(names)
+
+    if dry_run:
+        # Unbuffered so results line up with the [DRY RUN] messages
+        with ProgressPrinter(total, flush_every=1) as progress:
+            for i, (name, birthday) in enumerate(zip(names, birthdays), 1):
+                try:
+                    create_birthday_event(service, calendar_id, name, birthday, dry_run=True)
+                except ValueError as e:
+                    failed += 1
+                    progress.report(i, name, e)
+                    continue
+                progress.report(i, name)
+        return created_ids, failed
+
+    year = datetime.date.today().year
+    reported = set()
+    with ProgressPrinter(total) as progress:
+        def on_insert(request_id: str, response: Optional[Dict], exception: Optional[Exception]) -> None:
+            nonlocal failed
+            reported.add(request_id)
+            i = int(request_id)
+            if exception is None:
+                created_ids.append(response['id'])
+            else:
+                failed += 1
+            progress.report(i, names[i - 1], exception)
+
+        if not use_batch:
+            items = [(str(i), name, birthday) for i, (name, birthday) in enumerate(zip(names, birthdays), 1)]
+            insert_concurrently(service, creds, calendar_id, items, on_insert, max_workers)
+            return created_ids, failed
+
+        batches = []
+        for start in range(0, total, BATCH_SIZE):
+            requests = []
+            chunk = zip(names[start:start + BATCH_SIZE], birthdays[start:start + BATCH_SIZE])
+            for i, (name, birthday) in enumerate(chunk, start + 1):
+                try:
+                    body = build_event_body(name, birthday, year)
+                except ValueError as e:
+                    on_insert(str(i), None, e)
+                    continue
+                requests.append((str(i), service.events().insert(calendarId=calendar_id, body=body)))
+            if requests:
+                batches.append(requests)
+
+        for requests, e in execute_batches(service, batches, on_insert, creds, max_workers):
+            # Requests already answered in an earlier (rate-limit retry) round are done
+            pending = [request_id for request_id, _ in requests if request_id not in reported]
+            # Only an HTTP error response proves the batch was rejected; after a
+            # timeout or dropped connection the server may have created some of
+            # the events, so re-sending them could duplicate them
+            if creds is None or not isinstance(e, HttpError):
+                for request_id in pending:
+                    on_insert(request_id, None, e)
+                continue
+            logging.warning("Batch request failed (%s), retrying %d inserts individually", e, len(pending))
+            items = [(request_id, names[int(request_id) - 1], birthdays[int(request_id) - 1])
+                     for request_id in pending]
+            insert_concurrently(service, creds, calendar_id, items, on_insert, max_workers)
+
+    return created_ids, failed
+
+
+def rollback_events(service, calendar_id: str, event_ids: List[str], creds: Optional[Credentials] = None,
+                    max_workers: int = MAX_WORKERS):
     print_info(f"Rolling back {len(event_ids)} events...")
     count = 0
-    for eid in event_ids:
-        try:
-            service.events().delete(calendarId=calendar_id, eventId=eid).execute()
+    reported = set()
+
+    def on_delete(event_id: str, response: Optional[Dict], exception: Optional[Exception]) -> None:
+        nonlocal count
+        reported.add(event_id)
+        if exception is None:
             count += 1
-        except HttpError as e:
-            print_error(f"Failed to delete {eid}: {e}")
+        else:
+            print_error(f"Failed to delete {event_id}: {exception}")
+
+    batches = [[(eid, service.events().delete(calendarId=calendar_id, eventId=eid))
+                for eid in event_ids[start:start + BATCH_SIZE]]
+               for start in range(0, len(event_ids), BATCH_SIZE)]
+    for requests, e in execute_batches(service, batches, on_delete, creds, max_workers):
+        for eid, _ in requests:
+            if eid not in reported:
+                on_delete(eid, None, e)
     print_success(f"Rolled back {count} events")
 
 
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(description="Birthday to Google Calendar Importer")
     parser.add_argument("--file", help="Input file path")
@@ -295,8 +982,21 @@ def main():
     parser.add_argument("--calendar", help="Calendar ID (default: primary)")
     parser.add_argument("--date-fmt", choices=DATE_FORMAT_PATTERNS.keys(), default='DD/MM/YYYY')
     parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore the existing-events cache and fetch the whole calendar")
+    parser.add_argument("--no-batch", action="store_true", help="Insert events with concurrent single requests instead of batch requests")
+    parser.add_argument("--workers", type=positive_int, default=MAX_WORKERS, help=f"Concurrent API requests (default: {MAX_WORKERS})")
+    parser.add_argument("--debug", action="store_true", help="Write DEBUG records (including API client internals) to the log")
     args = parser.parse_args()
 
+    listener = setup_logging(logging.DEBUG if args.debug else logging.INFO)
+    try:
+        run(args)
+    finally:
+        listener.stop()
+
+
+def run(args: argparse.Namespace) -> None:
+    """Interactive import flow for parsed command-line arguments."""
     print_header("🎂 Birthday Importer")
 
     file_path = args.file or input("Enter file path: ").strip().strip('"')
@@ -305,44 +1005,55 @@ def main():
     date_fmt = args.date_fmt
     dry_run = args.dry_run or (not args.file and get_user_confirmation("Enable dry-run? (y/n) [no]: "))
 
+    print_info(f"Validating with format: {DATE_FORMAT_PATTERNS[date_fmt]['description']}")
     try:
-        df = load_data(file_path, name_col, date_col)
+        entries = load_data(file_path, name_col, date_col, date_fmt)
     except Exception as e:
         print_error(str(e)); sys.exit(1)
 
-    valid, invalid = validate_data(df, date_fmt)
+    valid, invalid = entries[entries["valid"]], entries[~entries["valid"]]
     preview_sample_dates(valid)
     preview_data(valid, invalid)
 
-    if not valid: print_error("No valid data."); sys.exit(1)
+    if valid.empty: print_error("No valid data."); sys.exit(1)
     if not get_user_confirmation(): sys.exit(0)
 
-    calendar_id = args.calendar or input("Calendar ID [primary]: ").strip() or 'primary'
+    # Repeated rows in the file need only one duplicate check and one insert
+    unique = valid.drop_duplicates(subset=["NameKey", "Birthday"])
+    within_file_duplicates = len(valid) - len(unique)
 
-    try:
-        service = authenticate_google_calendar()
-        existing = get_existing_events(service, calendar_id)
-    except Exception as e:
-        print_error(str(e)); sys.exit(1)
+    # A dry run stays offline: no credentials, no calendar lookups
+    creds = service = calendar_id = None
+    if dry_run:
+        to_create, duplicate_count = unique, 0
+    else:
+        calendar_id = args.calendar or input("Calendar ID [primary]: ").strip() or 'primary'
 
-    to_create = [e for e in valid if not is_duplicate(existing, e['Name'], e['Birthday'])]
-    print_info(f"Summary: {len(to_create)} new events, {len(valid)-len(to_create)} skips.\n")
+        try:
+            creds = get_credentials()
+            service = authenticate_google_calendar(creds)
+            existing = get_existing_events(service, calendar_id, use_cache=not args.no_cache)
+        except Exception as e:
+            print_error(str(e)); sys.exit(1)
+
+        duplicate = [is_duplicate(existing, name_key, birthday)
+                     for name_key, birthday in zip(unique["NameKey"], unique["Birthday"])]
+        duplicate_count = sum(duplicate)
+        to_create = unique[[not dup for dup in duplicate]]
+    print_info(f"Summary: {len(to_create)} new events, {duplicate_count} skips, "
+               f"{within_file_duplicates} repeated in file.\n")
 
-    if not to_create: sys.exit(0)
+    if to_create.empty: sys.exit(0)
     if not get_user_confirmation(): sys.exit(0)
 
-    created_ids = []
-    for i, entry in enumerate(to_create, 1):
-        try:
-            ev = create_birthday_event(service, calendar_id, entry['Name'], entry['Birthday'], dry_run)
-            if ev and not dry_run: created_ids.append(ev['id'])
-            print(f"[{i}/{len(to_create)}] ✓ {entry['Name']}")
-        except Exception as e:
-            print(f"[{i}/{len(to_create)}] ✗ {entry['Name']}: {e}")
+    created_ids, failed = create_birthday_events(service, calendar_id, to_create, dry_run, creds=creds,
+                                                 use_batch=not args.no_batch, max_workers=args.workers)
+    if not dry_run:
+        print_info(f"Created {len(created_ids)} events, {failed} failed.")
 
     if created_ids and not dry_run:
         if get_user_confirmation("Rollback all created events? (y/n): "):
-            rollback_events(service, calendar_id, created_ids)
+            rollback_events(service, calendar_id, created_ids, creds=creds, max_workers=args.workers)
     
     print_info(f"Done. Logs: {LOG_FILENAME}")
 
@@ -0,0 +1,88 @@
+"""Minimal stand-ins for the googleapiclient Calendar service."""
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+
+def http_error(status: int, content: bytes = b'', headers=None) -> HttpError:
+    resp = httplib2.Response({'status': status, **(headers or {})})
+    return HttpError(resp, content)
+
+
+class FakeRequest:
+    def __init__(self, result):
+        self.result = result
+
+    def execute(self, http=None):
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+class FakeEvents:
+    def __init__(self, service):
+        self.service = service
+
+    def list(self, **params):
+        self.service.list_calls.append(params)
+        return FakeRequest(self.service.list_responses.pop(0))
+
+    def insert(self, calendarId, body):
+        return FakeRequest({'id': f"ev-{body['summary']}"})
+
+    def delete(self, calendarId, eventId):
+        return FakeRequest('')
+
+
+class FakeBatch:
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.requests = {}
+
+    def add(self, request, request_id):
+        self.requests[request_id] = request
+
+    def execute(self, http=None):
+        self.service.batch_calls.append(list(self.requests))
+        self.service.batch_https.append(http)
+        outcome = self.service.batch_results.pop(0) if self.service.batch_results else {}
+        if isinstance(outcome, Exception):
+            raise outcome
+        for request_id, request in self.requests.items():
+            error = outcome.get(request_id)
+            self.callback(request_id, None if error else request.result, error)
+
+
+class FakeCalendars:
+    def __init__(self, service):
+        self.service = service
+
+    def get(self, calendarId, fields=None):
+        return FakeRequest({'id': self.service.account if calendarId == 'primary' else calendarId})
+
+
+class FakeService:
+    """Serves events.list responses (or errors) in order and records the list parameters.
+
+    Each batch call takes the next entry of batch_results: an exception
+    fails the whole call, a {request_id: error} dict fails those
+    sub-requests; every other sub-request succeeds.
+    """
+
+    def __init__(self, list_responses=(), batch_results=(), account='me@example.com'):
+        self.list_responses = list(list_responses)
+        self.list_calls = []
+        self.batch_results = list(batch_results)
+        self.batch_calls = []
+        self.batch_https = []
+        self.account = account
+
+    def new_batch_http_request(self, callback):
+        return FakeBatch(self, callback)
+
+    def events(self):
+        return FakeEvents(self)
+
+    def calendars(self):
+        return FakeCalendars(self)
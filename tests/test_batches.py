@@ -0,0 +1,96 @@
+import unittest
+from unittest import mock
+
+import birthday_calendar_importer as importer
+from tests.fakes import FakeService, http_error
+
+
+def inserts(service, *request_ids):
+    return [(request_id, service.events().insert(calendarId='primary', body={'summary': request_id}))
+            for request_id in request_ids]
+
+
+class ExecuteBatchTest(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(importer.time, 'sleep')
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.results = []
+
+    def callback(self, request_id, response, exception):
+        self.results.append((request_id, response, exception))
+
+    def test_throttled_sub_requests_are_retried_in_a_new_batch(self):
+        service = FakeService(batch_results=[{'2': http_error(429)}, {}])
+
+        importer.execute_batch(service, inserts(service, '1', '2', '3'), self.callback)
+
+        self.assertEqual(service.batch_calls, [['1', '2', '3'], ['2']])
+        self.assertEqual([(request_id, response) for request_id, response, _ in self.results],
+                         [('1', {'id': 'ev-1'}), ('3', {'id': 'ev-3'}), ('2', {'id': 'ev-2'})])
+        self.assertTrue(all(exception is None for _, _, exception in self.results))
+
+    def test_rate_limit_error_is_reported_after_max_retries(self):
+        throttled = http_error(403, b'{"error": {"errors": [{"reason": "rateLimitExceeded"}]}}')
+        service = FakeService(batch_results=[{'1': throttled}] * 3)
+
+        importer.execute_batch(service, inserts(service, '1', '2'), self.callback, max_retries=2)
+
+        self.assertEqual(service.batch_calls, [['1', '2'], ['1'], ['1']])
+        self.assertEqual(self.results[-1], ('1', None, throttled))
+        self.assertEqual(self.sleep.call_count, 2)
+
+    def test_whole_batch_retry_after_header_is_honoured(self):
+        service = FakeService(batch_results=[http_error(429, headers={'retry-after': '7'}), {}])
+
+        importer.execute_batch(service, inserts(service, '1'), self.callback)
+
+        self.sleep.assert_called_once_with(7)
+        self.assertEqual(self.results, [('1', {'id': 'ev-1'}, None)])
+
+    def test_whole_batch_failure_is_returned_to_the_caller(self):
+        rejected = http_error(400)
+        service = FakeService(batch_results=[{'2': http_error(429)}, rejected, {}])
+        first, second = inserts(service, '1', '2'), inserts(service, '3')
+
+        failures = importer.execute_batches(service, [first, second], self.callback)
+
+        # '1' was answered before the retry batch for '2' was rejected
+        self.assertEqual(failures, [(first, rejected)])
+        self.assertEqual([request_id for request_id, _, _ in self.results], ['1', '3'])
+
+    def test_concurrent_batches_use_one_authorized_http_per_worker(self):
+        service = FakeService()
+        batches = [inserts(service, str(i)) for i in range(6)]
+
+        with mock.patch.object(importer, 'AuthorizedHttp', side_effect=lambda creds, http: object()) as authorized, \
+                mock.patch.object(importer, 'build_http'):
+            failures = importer.execute_batches(service, batches, self.callback, creds=object(), max_workers=2)
+
+        self.assertEqual(failures, [])
+        self.assertEqual(sorted(request_id for request_id, _, _ in self.results), [str(i) for i in range(6)])
+        self.assertTrue(all(http is not None for http in service.batch_https))
+        self.assertLessEqual(authorized.call_count, 2)
+        self.assertEqual(len({id(http) for http in service.batch_https}), authorized.call_count)
+
+
+class RollbackEventsTest(unittest.TestCase):
+    def setUp(self):
+        for name in ('print_info', 'print_success', 'print_error'):
+            patcher = mock.patch.object(importer, name)
+            setattr(self, name, patcher.start())
+            self.addCleanup(patcher.stop)
+
+    def test_deletes_are_sent_in_batches(self):
+        event_ids = [f"e{i}" for i in range(importer.BATCH_SIZE + 10)]
+        service = FakeService(batch_results=[{'e3': http_error(404)}, {}])
+
+        importer.rollback_events(service, 'primary', event_ids)
+
+        self.assertEqual([len(ids) for ids in service.batch_calls], [importer.BATCH_SIZE, 10])
+        self.print_error.assert_called_once()
+        self.print_success.assert_called_once_with(f"Rolled back {len(event_ids) - 1} events")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import birthday_calendar_importer as importer
+from tests.fakes import FakeService, http_error
+
+
+def birthday(event_id, name, date):
+    return {'id': event_id, 'status': 'confirmed', 'summary': f"{name}'s Birthday", 'start': {'date': date}}
+
+
+class GetExistingEventsTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_file = os.path.join(tmp.name, 'cache.json')
+        patcher = mock.patch.object(importer, 'EVENTS_CACHE_FILE', self.cache_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(importer, 'print_info')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write_cache(self, key, updated, events):
+        with open(self.cache_file, 'w') as f:
+            json.dump({key: {'updated': updated, 'events': events}}, f)
+
+    def read_cache(self):
+        with open(self.cache_file) as f:
+            return json.load(f)
+
+    def test_full_fetch_without_cache(self):
+        service = FakeService([
+            {'updated': 'T1', 'nextPageToken': 'p2',
+             'items': [birthday('a', 'Ann', '2024-03-02'), {'id': 'm', 'summary': 'Meeting', 'start': {}}]},
+            {'items': [birthday('b', 'Bob', '2024-12-25')]},
+        ])
+
+        existing = importer.get_existing_events(service, 'primary')
+
+        self.assertEqual(existing, {'ann': {(3, 2)}, 'bob': {(12, 25)}})
+        self.assertEqual(service.list_calls[0]['q'], importer.BIRTHDAY_QUERY)
+        self.assertNotIn('updatedMin', service.list_calls[0])
+        self.assertEqual(service.list_calls[1]['pageToken'], 'p2')
+        self.assertEqual(self.read_cache(), {
+            'me@example.com|me@example.com': {'updated': 'T1', 'events': {'a': ['ann', 3, 2], 'b': ['bob', 12, 25]}},
+        })
+
+    def test_delta_sync_merges_changes_and_drops_cancelled_events(self):
+        self.write_cache('me@example.com|me@example.com', 'T1',
+                         {'a': ['ann', 3, 2], 'b': ['bob', 12, 25]})
+        service = FakeService([
+            {'updated': 'T2', 'items': [
+                {'id': 'a', 'status': 'cancelled'},
+                birthday('c', 'Cy', '2024-07-04'),
+            ]},
+        ])
+
+        existing = importer.get_existing_events(service, 'primary')
+
+        self.assertEqual(existing, {'bob': {(12, 25)}, 'cy': {(7, 4)}})
+        self.assertEqual(service.list_calls[0]['updatedMin'], 'T1')
+        self.assertTrue(service.list_calls[0]['showDeleted'])
+        self.assertNotIn('q', service.list_calls[0])
+        self.assertEqual(self.read_cache()['me@example.com|me@example.com']['updated'], 'T2')
+
+    def test_gone_watermark_falls_back_to_full_fetch(self):
+        self.write_cache('me@example.com|me@example.com', 'T0', {'a': ['ann', 3, 2]})
+        service = FakeService([
+            http_error(410),
+            {'updated': 'T3', 'items': [birthday('b', 'Bob', '2024-12-25')]},
+        ])
+
+        existing = importer.get_existing_events(service, 'primary')
+
+        self.assertEqual(existing, {'bob': {(12, 25)}})
+        self.assertEqual(service.list_calls[1]['q'], importer.BIRTHDAY_QUERY)
+        self.assertNotIn('updatedMin', service.list_calls[1])
+        self.assertEqual(self.read_cache()['me@example.com|me@example.com'],
+                         {'updated': 'T3', 'events': {'b': ['bob', 12, 25]}})
+
+    def test_primary_alias_is_cached_per_account(self):
+        self.write_cache('me@example.com|me@example.com', 'T1', {'a': ['ann', 3, 2]})
+        service = FakeService([{'updated': 'T4', 'items': []}], account='other@example.com')
+
+        existing = importer.get_existing_events(service, 'primary')
+
+        self.assertEqual(existing, {})
+        self.assertNotIn('updatedMin', service.list_calls[0])
+        self.assertEqual(set(self.read_cache()), {'me@example.com|me@example.com',
+                                                  'other@example.com|other@example.com'})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import datetime
+import unittest
+
+import pandas as pd
+
+from birthday_calendar_importer import REGEX_LAYOUTS, _parse_date_str, validate_data
+
+
+class ValidateDataTest(unittest.TestCase):
+    def test_out_of_range_years_are_reported_not_raised(self):
+        df = pd.DataFrame({
+            "Name": ["Ann", "Bob", "Cy"],
+            "Birthday": ["15/01/1500", "02/03/1990", "05/03/2999"],
+        })
+
+        entries = validate_data(df, "DD/MM/YYYY")
+
+        self.assertEqual(entries["valid"].tolist(), [False, True, False])
+        self.assertEqual(entries["Errors"].tolist(),
+                         [("Invalid year: 1500",), (), ("Invalid year: 2999",)])
+        self.assertEqual(entries["Birthday"].iat[1], pd.Timestamp(1990, 3, 2))
+
+    def test_out_of_range_datetime_cells_are_reported_not_raised(self):
+        # Excel columns can mix text with real datetime cells
+        df = pd.DataFrame({
+            "Name": ["Ann", "Bob", "Cy", "Di"],
+            "Birthday": [datetime.datetime(2999, 3, 5), "02/03/1990",
+                         datetime.datetime(1500, 1, 15), datetime.datetime(1985, 7, 4)],
+        })
+
+        entries = validate_data(df, "DD/MM/YYYY")
+
+        self.assertEqual(entries["valid"].tolist(), [False, True, False, True])
+        self.assertEqual(entries["Errors"].tolist(),
+                         [("Invalid year: 2999",), (), ("Invalid year: 1500",), ()])
+        self.assertEqual(entries["Birthday"].iat[3], pd.Timestamp(1985, 7, 4))
+
+
+class RegexFastPathTest(unittest.TestCase):
+    def test_layouts_follow_the_strict_formats(self):
+        self.assertIn(('dmY', ' '), REGEX_LAYOUTS['DD/MM/YYYY'])
+        self.assertNotIn(('mdY', ' '), REGEX_LAYOUTS['MM/DD/YYYY'])
+        self.assertNotIn(('Ymd', '.'), REGEX_LAYOUTS['DD/MM/YYYY'])
+        self.assertNotIn(('dmY', '/'), REGEX_LAYOUTS['YYYY-MM-DD'])
+
+    def test_layouts_outside_the_strict_formats_skip_the_fast_path(self):
+        with self.assertLogs(level='WARNING') as logs:
+            self.assertEqual(_parse_date_str('12 25 1990', 'MM/DD/YYYY'), (datetime.date(1990, 12, 25), None))
+        self.assertIn('Fuzzy parsed', logs.output[0])
+
+    def test_fast_path_dates(self):
+        self.assertEqual(_parse_date_str('5.3.1990', 'DD/MM/YYYY'), (datetime.date(1990, 3, 5), None))
+        self.assertEqual(_parse_date_str('3-5-1990', 'MM/DD/YYYY'), (datetime.date(1990, 3, 5), None))
+        self.assertEqual(_parse_date_str('1990/03/05', 'YYYY-MM-DD'), (datetime.date(1990, 3, 5), None))
+
+
+if __name__ == "__main__":
+    unittest.main()